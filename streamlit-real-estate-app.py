@@ -1,9 +1,6 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime, timedelta
 import math
 
 # Page configuration
@@ -14,9 +11,16 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS, built once at import time. A session_state "inject once"
+# guard does not work here: Streamlit removes elements that are not
+# re-emitted on rerun, so the (prebuilt) block is sent every run.
+_CSS_BLOCK = """
 <style>
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+    }
     .main-header {
         font-size: 2.5rem;
         color: #1f2937;
@@ -55,7 +59,200 @@ st.markdown("""
         padding-bottom: 0.5rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_CSS_BLOCK, unsafe_allow_html=True)
+
+# Static demo data, built once at import time instead of on every rerun
+_DEALS_DF = pd.DataFrame({
+    'Property': ['Sunset Apartments', 'Downtown Office Complex', 'Industrial Warehouse'],
+    'Location': ['Austin, TX', 'Denver, CO', 'Phoenix, AZ'],
+    'Type': ['Multifamily', 'Office', 'Industrial'],
+    'Price': ['$2.45M', '$8.95M', '$3.20M'],
+    'ROI': ['8.5%', '7.3%', '9.1%'],
+    'Status': ['Analyzing', 'Pending', 'Completed']
+})
+
+_RENT_ROLL_DF = pd.DataFrame({
+    'Suite': ['101', '105', '107', '109'],
+    'Tenant': ['Geek Out, Inc.', 'JXWX Enterprises', 'Brandon A. Mantilla', 'Jory International'],
+    'Square Feet': [4021, 1800, 1021, 1200],
+    'Rate/SF': [19.74, 26.00, 22.00, 19.38],
+    'Monthly Rent': [6614, 3900, 1872, 1938],
+    'Lease Start': ['2023-01-01', '2023-03-01', '2023-02-15', '2023-04-01'],
+    'Lease End': ['2025-12-31', '2026-02-28', '2025-02-14', '2026-03-31'],
+    'Status': ['Active', 'Active', 'Active', 'Active']
+})
+
+_EXPENSES_DF = pd.DataFrame({
+    'Date': ['2024-01-15', '2024-01-20', '2024-02-01', '2024-02-15'],
+    'Category': ['Repairs & Maintenance', 'Property Management', 'Insurance', 'Utilities'],
+    'Amount': [1250.00, 550.00, 412.50, 183.75],
+    'Description': ['HVAC Repair Unit 105', 'Monthly Management Fee', 'Quarterly Insurance Premium', 'Electric Bill'],
+    'Vendor': ['ABC HVAC Services', 'Premier Property Mgmt', 'State Farm Insurance', 'Texas Electric']
+})
+_EXPENSES_BY_CATEGORY = _EXPENSES_DF.groupby('Category')['Amount'].sum()
+
+# Comps stay numeric; display formatting is handled by column_config
+_COMPS_DF = pd.DataFrame({
+    'Property': ['Oak Street Apartments', 'Riverside Complex', 'Metro Gardens', 'Sunset Plaza'],
+    'Distance': ['0.3 miles', '0.7 miles', '1.2 miles', '1.5 miles'],
+    'Units': [124, 96, 156, 88],
+    'Sale Price': [2800000, 2100000, 3400000, 1950000],
+    'Price/SF': [290, 275, 295, 285],
+    'Cap Rate': [6.2, 6.8, 5.9, 7.1],
+    'Sale Date': ['2024-01-15', '2023-11-30', '2024-02-20', '2023-12-10']
+})
+_AVG_COMP_PRICE_SF = _COMPS_DF['Price/SF'].mean()
+_AVG_COMP_CAP_RATE = _COMPS_DF['Cap Rate'].mean()
+
+_DOCS_DF = pd.DataFrame({
+    'Document': [
+        'Purchase Agreement - Sunset Apartments.pdf',
+        'LOI - Downtown Office Complex.pdf',
+        'Partnership Agreement - Phoenix Warehouse.pdf',
+        'Inspection Report - Sunset Apartments.pdf'
+    ],
+    'Type': ['Contract', 'LOI', 'Partnership', 'Report'],
+    'Upload Date': ['2024-01-15', '2024-01-14', '2024-01-12', '2024-01-16'],
+    'Size': ['2.4 MB', '1.8 MB', '3.1 MB', '5.2 MB'],
+    'AI Status': ['✅ Reviewed', '⚠️ Issues Found', '🔄 Processing', '✅ Reviewed']
+})
+
+_COLLAB_DF = pd.DataFrame({
+    'Deal': ['Sunset Apartments', 'Downtown Office Complex', 'Industrial Warehouse'],
+    'Partners': ['3 partners', '2 partners', '4 partners'],
+    'Status': ['Active', 'Pending Signatures', 'Under Review'],
+    'Last Activity': ['2 hours ago', '1 day ago', '3 hours ago']
+})
+
+try:
+    from numba import vectorize
+
+    @vectorize(['float64(float64, float64, float64)'], cache=True, fastmath=True)
+    def _mortgage_payment(loan_amount, annual_rate, years):
+        """Monthly mortgage payment kernel, JIT-compiled and broadcastable.
+
+        Accepts scalars or arrays of any argument, so rate/term sensitivity
+        grids run at C speed through the same entry point.
+        """
+        if annual_rate == 0.0:
+            return loan_amount / (years * 12.0)
+        mr = annual_rate / 100.0 / 12.0
+        n = years * 12.0
+        g = (1.0 + mr) ** n
+        return loan_amount * mr * g / (g - 1.0)
+except ImportError:
+    def _mortgage_payment(loan_amount, annual_rate, years):
+        """Monthly mortgage payment (NumPy fallback when numba is absent)."""
+        monthly_rate = np.asarray(annual_rate, dtype=np.float64) / 100 / 12
+        num_payments = np.asarray(years, dtype=np.float64) * 12
+        with np.errstate(divide='ignore', invalid='ignore'):
+            g = (1 + monthly_rate) ** num_payments
+            payment = loan_amount * monthly_rate * g / (g - 1)
+        return np.where(monthly_rate == 0, loan_amount / num_payments, payment)
+
+def _fast_inputs_hash(d):
+    """Cache key for the inputs dict: tuple hashing 12 scalars is far
+    cheaper than the default pickle-and-digest pass on every rerun."""
+    return hash(tuple(sorted(d.items())))
+
+@st.cache_data(ttl=3600, hash_funcs={dict: _fast_inputs_hash})
+def _calc_scenarios_cached(inputs, dp_pct_tuple, terms_tuple):
+    """Vectorized scenario metrics, cached on the inputs dict.
+
+    The inputs dict is hashed via _fast_inputs_hash so identical inputs
+    hit the same cache entry across reruns; dp_pct_tuple holds down-payment
+    fractions and terms_tuple loan terms in years, one entry per scenario.
+    Returns a dict of 1-D arrays.
+    """
+    purchase_price = inputs['purchase_price']
+    dp_pct = np.asarray(dp_pct_tuple)
+    terms = np.asarray(terms_tuple)
+
+    down_payment = purchase_price * dp_pct
+    loan_amount = purchase_price - down_payment
+
+    # Monthly payment calculation (element-wise across scenarios)
+    monthly_rate = inputs['interest_rate'] / 100 / 12
+    num_payments = terms * 12
+    if monthly_rate == 0:
+        monthly_payment = loan_amount / num_payments
+    else:
+        growth = (1 + monthly_rate) ** num_payments
+        monthly_payment = loan_amount * (monthly_rate * growth) / (growth - 1)
+    annual_debt_service = monthly_payment * 12
+
+    # Income calculations (scalar, shared across scenarios)
+    gross_rent_income = inputs['monthly_rent'] * 12
+    vacancy_loss = gross_rent_income * (inputs['vacancy_rate'] / 100)
+    effective_gross_income = gross_rent_income - vacancy_loss + inputs['other_income']
+
+    # Operating expenses
+    total_operating_expenses = (
+        inputs['property_taxes'] + inputs['insurance'] +
+        inputs['repairs_maintenance'] + inputs['property_management'] +
+        inputs['utilities'] + inputs['cam_charges']
+    )
+
+    # Key metrics
+    noi = effective_gross_income - total_operating_expenses
+    cash_flow = noi - annual_debt_service
+    total_cash_invested = down_payment + inputs['closing_costs']
+    cash_on_cash_return = np.where(
+        total_cash_invested > 0, (cash_flow / total_cash_invested) * 100, 0
+    )
+    cap_rate = (noi / purchase_price) * 100
+    dscr = np.where(annual_debt_service > 0, noi / annual_debt_service, 0)
+
+    num_scenarios = len(dp_pct_tuple)
+    return {
+        'down_payment': down_payment,
+        'loan_amount': loan_amount,
+        'monthly_payment': monthly_payment,
+        'annual_debt_service': annual_debt_service,
+        'gross_rent_income': np.full(num_scenarios, gross_rent_income),
+        'effective_gross_income': np.full(num_scenarios, effective_gross_income),
+        'total_operating_expenses': np.full(num_scenarios, total_operating_expenses),
+        'noi': np.full(num_scenarios, noi),
+        'cash_flow': cash_flow,
+        'total_cash_invested': total_cash_invested,
+        'cash_on_cash_return': cash_on_cash_return,
+        'cap_rate': np.full(num_scenarios, cap_rate),
+        'dscr': dscr
+    }
+
+@st.cache_data(ttl=3600)
+def _amortization_cached(loan_amount, annual_rate, years, num_payments_to_show):
+    """Amortization schedule DataFrame, cached on the loan parameters."""
+    monthly_rate = annual_rate / 100 / 12
+    num_payments = years * 12
+    monthly_payment = _mortgage_payment(loan_amount, annual_rate, years)
+
+    n = min(num_payments_to_show, num_payments)
+    k = np.arange(1, n + 1)
+
+    if monthly_rate == 0:
+        balance = loan_amount - monthly_payment * k
+        interest = np.zeros(n)
+    else:
+        # Closed-form balance after k payments:
+        #   B_k = L*(1+r)^k - P*((1+r)^k - 1)/r
+        growth = (1 + monthly_rate) ** k
+        balance = loan_amount * growth - monthly_payment * (growth - 1) / monthly_rate
+        interest = np.empty(n)
+        interest[0] = loan_amount * monthly_rate
+        interest[1:] = balance[:-1] * monthly_rate
+    principal = monthly_payment - interest
+
+    return pd.DataFrame({
+        'Payment': k,
+        'Date': pd.date_range(start=pd.Timestamp.today().normalize(), periods=n, freq='MS'),
+        'Payment Amount': monthly_payment,
+        'Principal': principal,
+        'Interest': interest,
+        'Balance': np.maximum(balance, 0)
+    })
 
 class RealEstateCalculator:
     def __init__(self):
@@ -65,17 +262,19 @@ class RealEstateCalculator:
             {"name": "Scenario 3", "down_payment_pct": 35, "loan_term": 25, "balloon_term": 5},
             {"name": "Scenario 4", "down_payment_pct": 35, "loan_term": 20, "balloon_term": None}
         ]
+        # Columnar (SoA) mirror of the scenario table: the vectorized path
+        # reads these arrays directly instead of chasing per-dict lookups.
+        # The dict list above stays for the scenario cards and table labels.
+        self._dp_pct = np.array([0.30, 0.30, 0.35, 0.35])
+        self._terms = np.array([25, 20, 25, 20])
+        self._names = ('Scenario 1', 'Scenario 2', 'Scenario 3', 'Scenario 4')
+        self._balloons = (5, None, 5, None)
+        # Hashable form of the columns, precomputed for the cache key
+        self._scenario_key = (tuple(self._dp_pct.tolist()), tuple(self._terms.tolist()))
     
     def calculate_mortgage_payment(self, loan_amount, annual_rate, years):
         """Calculate monthly mortgage payment"""
-        if annual_rate == 0:
-            return loan_amount / (years * 12)
-        
-        monthly_rate = annual_rate / 100 / 12
-        num_payments = years * 12
-        
-        payment = loan_amount * (monthly_rate * (1 + monthly_rate)**num_payments) / ((1 + monthly_rate)**num_payments - 1)
-        return payment
+        return _mortgage_payment(loan_amount, annual_rate, years)
     
     def calculate_scenario_metrics(self, inputs, scenario):
         """Calculate all financial metrics for a scenario"""
@@ -125,30 +324,19 @@ class RealEstateCalculator:
             'dscr': dscr
         }
     
+    def calculate_all_scenarios(self, inputs):
+        """Calculate metrics for every scenario in one vectorized pass.
+
+        Returns a dict of 1-D arrays aligned with self.scenarios, so callers
+        can index by scenario position instead of recomputing per scenario.
+        Identical inputs hit the st.cache_data entry instead of recomputing.
+        """
+        dp_pct_tuple, terms_tuple = self._scenario_key
+        return _calc_scenarios_cached(inputs, dp_pct_tuple, terms_tuple)
+
     def generate_amortization_schedule(self, loan_amount, annual_rate, years, num_payments_to_show=60):
         """Generate amortization schedule"""
-        monthly_rate = annual_rate / 100 / 12
-        num_payments = years * 12
-        monthly_payment = self.calculate_mortgage_payment(loan_amount, annual_rate, years)
-        
-        schedule = []
-        balance = loan_amount
-        
-        for payment_num in range(1, min(num_payments_to_show + 1, num_payments + 1)):
-            interest_payment = balance * monthly_rate
-            principal_payment = monthly_payment - interest_payment
-            balance -= principal_payment
-            
-            schedule.append({
-                'Payment': payment_num,
-                'Date': datetime.now() + timedelta(days=30 * payment_num),
-                'Payment Amount': monthly_payment,
-                'Principal': principal_payment,
-                'Interest': interest_payment,
-                'Balance': max(0, balance)
-            })
-        
-        return pd.DataFrame(schedule)
+        return _amortization_cached(loan_amount, annual_rate, years, num_payments_to_show)
 
 def main():
     st.markdown('<h1 class="main-header">🏢 Real Estate Deal Evaluation Platform</h1>', unsafe_allow_html=True)
@@ -177,61 +365,41 @@ def main():
         show_collaboration()
 
 def show_dashboard():
+    # Deferred so chart-free pages skip the plotly import cost on cold start
+    import plotly.graph_objects as go
+
     st.markdown('<div class="section-header">📊 Portfolio Dashboard</div>', unsafe_allow_html=True)
     
-    # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
+    # Key metrics: one grid element instead of four columns of markdown
+    st.markdown("""
+    <div class="metric-grid">
         <div class="metric-card">
             <h3>$14.6M</h3>
             <p>Total Portfolio Value</p>
             <small>+12% from last quarter</small>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
         <div class="metric-card">
             <h3>8</h3>
             <p>Active Deals</p>
             <small>3 pending analysis</small>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
         <div class="metric-card">
             <h3>8.3%</h3>
             <p>Average ROI</p>
             <small>Above market average</small>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
         <div class="metric-card">
             <h3>Low</h3>
             <p>Risk Score</p>
             <small>Well diversified</small>
         </div>
-        """, unsafe_allow_html=True)
+    </div>
+    """, unsafe_allow_html=True)
     
     # Recent deals
     st.markdown('<div class="section-header">🏠 Recent Deals</div>', unsafe_allow_html=True)
     
-    deals_data = {
-        'Property': ['Sunset Apartments', 'Downtown Office Complex', 'Industrial Warehouse'],
-        'Location': ['Austin, TX', 'Denver, CO', 'Phoenix, AZ'],
-        'Type': ['Multifamily', 'Office', 'Industrial'],
-        'Price': ['$2.45M', '$8.95M', '$3.20M'],
-        'ROI': ['8.5%', '7.3%', '9.1%'],
-        'Status': ['Analyzing', 'Pending', 'Completed']
-    }
-    
-    df_deals = pd.DataFrame(deals_data)
-    st.dataframe(df_deals, use_container_width=True)
+    st.dataframe(_DEALS_DF, use_container_width=True)
     
     # Portfolio performance chart
     st.markdown('<div class="section-header">📈 Portfolio Performance</div>', unsafe_allow_html=True)
@@ -261,99 +429,130 @@ def show_dashboard():
 
 def show_roi_calculator(calc):
     st.markdown('<div class="section-header">🧮 ROI Calculator</div>', unsafe_allow_html=True)
-    
-    # Input form
-    with st.expander("🏢 Property Details & Assumptions", expanded=True):
-        col1, col2, col3 = st.columns(3)
-        
+
+    _roi_calc_body(calc)
+
+@st.fragment
+def _roi_calc_body(calc):
+    """Interactive calculator body; widget changes rerun only this fragment."""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    # Input form: widgets inside the form do not trigger reruns; one rerun
+    # fires per Calculate click instead of per keystroke
+    with st.form('roi_input_form'):
+        with st.expander("🏢 Property Details & Assumptions", expanded=True):
+            col1, col2, col3 = st.columns(3)
+
+            with col1:
+                st.subheader("💰 Purchase Information")
+                purchase_price = st.number_input("Purchase Price ($)", value=2475000, step=1000, format="%d")
+                interest_rate = st.number_input("Interest Rate (%)", value=6.75, step=0.01, format="%.2f")
+                closing_costs = st.number_input("Closing Costs ($)", value=24750, step=100, format="%d")
+
+            with col2:
+                st.subheader("🏠 Income Information")
+                monthly_rent = st.number_input("Monthly Rent Income ($)", value=17956, step=100, format="%d")
+                vacancy_rate = st.number_input("Vacancy Rate (%)", value=5.0, step=0.1, format="%.1f")
+                other_income = st.number_input("Other Income (Annual $)", value=1200, step=100, format="%d")
+
+            with col3:
+                st.subheader("🔧 Operating Expenses")
+                property_taxes = st.number_input("Property Taxes ($)", value=9900, step=100, format="%d")
+                insurance = st.number_input("Insurance ($)", value=4950, step=100, format="%d")
+                repairs_maintenance = st.number_input("Repairs & Maintenance ($)", value=8250, step=100, format="%d")
+                property_management = st.number_input("Property Management ($)", value=6600, step=100, format="%d")
+                utilities = st.number_input("Utilities ($)", value=2200, step=100, format="%d")
+
+                use_cam = st.checkbox("Include CAM Charges")
+                cam_input = st.number_input("CAM Charges ($)", value=0, step=100, format="%d")
+
+        # Additional parameters
+        col1, col2 = st.columns(2)
         with col1:
-            st.subheader("💰 Purchase Information")
-            purchase_price = st.number_input("Purchase Price ($)", value=2475000, step=1000, format="%d")
-            interest_rate = st.number_input("Interest Rate (%)", value=6.75, step=0.01, format="%.2f")
-            closing_costs = st.number_input("Closing Costs ($)", value=24750, step=100, format="%d")
-        
+            appreciation_rate = st.number_input("Appreciation Rate (%)", value=3.0, step=0.1, format="%.1f")
         with col2:
-            st.subheader("🏠 Income Information")
-            monthly_rent = st.number_input("Monthly Rent Income ($)", value=17956, step=100, format="%d")
-            vacancy_rate = st.number_input("Vacancy Rate (%)", value=5.0, step=0.1, format="%.1f")
-            other_income = st.number_input("Other Income (Annual $)", value=1200, step=100, format="%d")
-        
-        with col3:
-            st.subheader("🔧 Operating Expenses")
-            property_taxes = st.number_input("Property Taxes ($)", value=9900, step=100, format="%d")
-            insurance = st.number_input("Insurance ($)", value=4950, step=100, format="%d")
-            repairs_maintenance = st.number_input("Repairs & Maintenance ($)", value=8250, step=100, format="%d")
-            property_management = st.number_input("Property Management ($)", value=6600, step=100, format="%d")
-            utilities = st.number_input("Utilities ($)", value=2200, step=100, format="%d")
-            
-            use_cam = st.checkbox("Include CAM Charges")
-            cam_charges = st.number_input("CAM Charges ($)", value=0, step=100, format="%d") if use_cam else 0
-    
-    # Additional parameters
-    col1, col2 = st.columns(2)
-    with col1:
-        appreciation_rate = st.number_input("Appreciation Rate (%)", value=3.0, step=0.1, format="%.1f")
-    with col2:
-        rent_increase_rate = st.number_input("Annual Rent Increase (%)", value=2.5, step=0.1, format="%.1f")
-    
-    # Prepare inputs
-    inputs = {
-        'purchase_price': purchase_price,
-        'interest_rate': interest_rate,
-        'closing_costs': closing_costs,
-        'monthly_rent': monthly_rent,
-        'vacancy_rate': vacancy_rate,
-        'other_income': other_income,
-        'property_taxes': property_taxes,
-        'insurance': insurance,
-        'repairs_maintenance': repairs_maintenance,
-        'property_management': property_management,
-        'utilities': utilities,
-        'cam_charges': cam_charges
-    }
-    
+            rent_increase_rate = st.number_input("Annual Rent Increase (%)", value=2.5, step=0.1, format="%.1f")
+
+        submitted = st.form_submit_button("Calculate Scenarios")
+
+    if submitted:
+        # Persist the submitted inputs so other pages/tabs don't reset them
+        st.session_state['roi_inputs'] = {
+            'purchase_price': purchase_price,
+            'interest_rate': interest_rate,
+            'closing_costs': closing_costs,
+            'monthly_rent': monthly_rent,
+            'vacancy_rate': vacancy_rate,
+            'other_income': other_income,
+            'property_taxes': property_taxes,
+            'insurance': insurance,
+            'repairs_maintenance': repairs_maintenance,
+            'property_management': property_management,
+            'utilities': utilities,
+            'cam_charges': cam_input if use_cam else 0
+        }
+
+    inputs = st.session_state.get('roi_inputs')
+    if inputs is None:
+        st.info("Set your assumptions above and click **Calculate Scenarios** to run the 4-scenario analysis.")
+        return
+
     # Calculate scenarios
     st.markdown('<div class="section-header">📊 4-Scenario Analysis</div>', unsafe_allow_html=True)
     
-    # Create comparison table
-    results = []
-    for scenario in calc.scenarios:
-        metrics = calc.calculate_scenario_metrics(inputs, scenario)
-        results.append({
-            'Scenario': scenario['name'],
-            'Down Payment %': f"{scenario['down_payment_pct']}%",
-            'Down Payment $': f"${metrics['down_payment']:,.0f}",
-            'Loan Amount': f"${metrics['loan_amount']:,.0f}",
-            'Loan Term': f"{scenario['loan_term']} years",
-            'Balloon': f"{scenario['balloon_term']} years" if scenario['balloon_term'] else "None",
-            'NOI': f"${metrics['noi']:,.0f}",
-            'Debt Service': f"${metrics['annual_debt_service']:,.0f}",
-            'Cash Flow': f"${metrics['cash_flow']:,.0f}",
-            'CoC Return': f"{metrics['cash_on_cash_return']:.2f}%",
-            'Cap Rate': f"{metrics['cap_rate']:.2f}%",
-            'DSCR': f"{metrics['dscr']:.2f}"
-        })
-    
-    df_results = pd.DataFrame(results)
-    st.dataframe(df_results, use_container_width=True)
+    # Compute all scenarios in one vectorized pass
+    metrics = calc.calculate_all_scenarios(inputs)
+    scenario_names = list(calc._names)
+
+    # Comparison table stays numeric; formatting happens client-side via
+    # column_config, which keeps columns sortable and the payload compact
+    df_results = pd.DataFrame({
+        'Scenario': scenario_names,
+        'Down Payment %': [s['down_payment_pct'] for s in calc.scenarios],
+        'Down Payment $': metrics['down_payment'],
+        'Loan Amount': metrics['loan_amount'],
+        'Loan Term': [s['loan_term'] for s in calc.scenarios],
+        'Balloon': [f"{s['balloon_term']} years" if s['balloon_term'] else "None" for s in calc.scenarios],
+        'NOI': metrics['noi'],
+        'Debt Service': metrics['annual_debt_service'],
+        'Cash Flow': metrics['cash_flow'],
+        'CoC Return': metrics['cash_on_cash_return'],
+        'Cap Rate': metrics['cap_rate'],
+        'DSCR': metrics['dscr']
+    })
+    st.dataframe(
+        df_results,
+        use_container_width=True,
+        column_config={
+            'Down Payment %': st.column_config.NumberColumn(format='%d%%'),
+            'Down Payment $': st.column_config.NumberColumn(format='dollar'),
+            'Loan Amount': st.column_config.NumberColumn(format='dollar'),
+            'Loan Term': st.column_config.NumberColumn(format='%d years'),
+            'NOI': st.column_config.NumberColumn(format='dollar'),
+            'Debt Service': st.column_config.NumberColumn(format='dollar'),
+            'Cash Flow': st.column_config.NumberColumn(format='dollar'),
+            'CoC Return': st.column_config.NumberColumn(format='%.2f%%'),
+            'Cap Rate': st.column_config.NumberColumn(format='%.2f%%'),
+            'DSCR': st.column_config.NumberColumn(format='%.2f')
+        }
+    )
     
     # Scenario cards
     st.markdown('<div class="section-header">📈 Scenario Summary</div>', unsafe_allow_html=True)
     
     cols = st.columns(4)
     for i, scenario in enumerate(calc.scenarios):
-        metrics = calc.calculate_scenario_metrics(inputs, scenario)
-        
         with cols[i]:
-            cash_flow_color = "highlight-positive" if metrics['cash_flow'] > 0 else "highlight-negative"
-            
+            cash_flow_color = "highlight-positive" if metrics['cash_flow'][i] > 0 else "highlight-negative"
+
             st.markdown(f"""
             <div class="scenario-card">
                 <h4>{scenario['name']}</h4>
                 <p><strong>Down Payment:</strong> {scenario['down_payment_pct']}%</p>
-                <p><strong>Cash Flow:</strong> <span class="{cash_flow_color}">${metrics['cash_flow']:,.0f}</span></p>
-                <p><strong>CoC Return:</strong> {metrics['cash_on_cash_return']:.2f}%</p>
-                <p><strong>DSCR:</strong> {metrics['dscr']:.2f}</p>
+                <p><strong>Cash Flow:</strong> <span class="{cash_flow_color}">${metrics['cash_flow'][i]:,.0f}</span></p>
+                <p><strong>CoC Return:</strong> {metrics['cash_on_cash_return'][i]:.2f}%</p>
+                <p><strong>DSCR:</strong> {metrics['dscr'][i]:.2f}</p>
             </div>
             """, unsafe_allow_html=True)
     
@@ -361,90 +560,87 @@ def show_roi_calculator(calc):
     st.markdown('<div class="section-header">🎯 Performance Comparison</div>', unsafe_allow_html=True)
     
     # Extract data for charts
-    scenario_names = [s['name'] for s in calc.scenarios]
-    cash_flows = [calc.calculate_scenario_metrics(inputs, s)['cash_flow'] for s in calc.scenarios]
-    coc_returns = [calc.calculate_scenario_metrics(inputs, s)['cash_on_cash_return'] for s in calc.scenarios]
-    
-    col1, col2 = st.columns(2)
-    
+    cash_flows = metrics['cash_flow']
+    coc_returns = metrics['cash_on_cash_return']
+
+    # One figure with two subplots keeps this to a single render pass
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("Annual Cash Flow by Scenario", "Cash-on-Cash Return by Scenario")
+    )
+    fig.add_trace(go.Bar(
+        x=scenario_names, y=cash_flows,
+        marker=dict(color=cash_flows, colorscale='RdYlGn')
+    ), row=1, col=1)
+    fig.add_trace(go.Bar(
+        x=scenario_names, y=coc_returns,
+        marker=dict(color=coc_returns, colorscale='Viridis')
+    ), row=1, col=2)
+    fig.update_yaxes(title_text='Cash Flow ($)', row=1, col=1)
+    fig.update_yaxes(title_text='CoC Return (%)', row=1, col=2)
+    fig.update_layout(template='plotly_white', showlegend=False)
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def _amortization_tab(calc):
+    """Amortization tab body; the Generate button reruns only this fragment."""
+    st.subheader("📅 Amortization Schedule")
+
+    col1, col2, col3 = st.columns(3)
     with col1:
-        fig_cash_flow = px.bar(
-            x=scenario_names, y=cash_flows,
-            title="Annual Cash Flow by Scenario",
-            labels={'x': 'Scenario', 'y': 'Cash Flow ($)'},
-            color=cash_flows,
-            color_continuous_scale='RdYlGn'
-        )
-        fig_cash_flow.update_layout(template='plotly_white')
-        st.plotly_chart(fig_cash_flow, use_container_width=True)
-    
+        loan_amount = st.number_input("Loan Amount", value=1732500, step=1000)
     with col2:
-        fig_coc = px.bar(
-            x=scenario_names, y=coc_returns,
-            title="Cash-on-Cash Return by Scenario",
-            labels={'x': 'Scenario', 'y': 'CoC Return (%)'},
-            color=coc_returns,
-            color_continuous_scale='Viridis'
+        annual_rate = st.number_input("Interest Rate (%)", value=6.75, step=0.01)
+    with col3:
+        loan_years = st.number_input("Loan Term (years)", value=25, step=1)
+
+    num_payments = st.slider("Number of payments to show", 12, 360, 60)
+
+    if st.button("Generate Schedule"):
+        schedule_df = calc.generate_amortization_schedule(loan_amount, annual_rate, loan_years, num_payments)
+
+        # Format at display time instead of materializing string columns
+        styled = schedule_df.style.format({
+            'Date': lambda d: d.strftime('%Y-%m-%d'),
+            'Payment Amount': '${:,.2f}',
+            'Principal': '${:,.2f}',
+            'Interest': '${:,.2f}',
+            'Balance': '${:,.2f}'
+        })
+
+        st.dataframe(styled, use_container_width=True)
+
+        # Download option
+        csv = schedule_df.to_csv(index=False, float_format='%.2f', date_format='%Y-%m-%d')
+        st.download_button(
+            label="Download as CSV",
+            data=csv,
+            file_name="amortization_schedule.csv",
+            mime="text/csv"
         )
-        fig_coc.update_layout(template='plotly_white')
-        st.plotly_chart(fig_coc, use_container_width=True)
 
 def show_deal_analysis(calc):
+    import plotly.express as px
+
     st.markdown('<div class="section-header">📋 Deal Analysis Tools</div>', unsafe_allow_html=True)
     
     tabs = st.tabs(["Amortization Schedule", "Rent Roll Tracker", "Expense Log", "Market Comparables"])
     
     with tabs[0]:
-        st.subheader("📅 Amortization Schedule")
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            loan_amount = st.number_input("Loan Amount", value=1732500, step=1000)
-        with col2:
-            annual_rate = st.number_input("Interest Rate (%)", value=6.75, step=0.01)
-        with col3:
-            loan_years = st.number_input("Loan Term (years)", value=25, step=1)
-        
-        num_payments = st.slider("Number of payments to show", 12, 360, 60)
-        
-        if st.button("Generate Schedule"):
-            schedule_df = calc.generate_amortization_schedule(loan_amount, annual_rate, loan_years, num_payments)
-            
-            # Format the dataframe
-            schedule_df['Date'] = schedule_df['Date'].dt.strftime('%Y-%m-%d')
-            schedule_df['Payment Amount'] = schedule_df['Payment Amount'].apply(lambda x: f"${x:,.2f}")
-            schedule_df['Principal'] = schedule_df['Principal'].apply(lambda x: f"${x:,.2f}")
-            schedule_df['Interest'] = schedule_df['Interest'].apply(lambda x: f"${x:,.2f}")
-            schedule_df['Balance'] = schedule_df['Balance'].apply(lambda x: f"${x:,.2f}")
-            
-            st.dataframe(schedule_df, use_container_width=True)
-            
-            # Download option
-            csv = schedule_df.to_csv(index=False)
-            st.download_button(
-                label="Download as CSV",
-                data=csv,
-                file_name="amortization_schedule.csv",
-                mime="text/csv"
-            )
-    
+        _amortization_tab(calc)
+
     with tabs[1]:
         st.subheader("🏠 Rent Roll Tracker")
         
-        # Sample rent roll data
-        rent_roll_data = {
-            'Suite': ['101', '105', '107', '109'],
-            'Tenant': ['Geek Out, Inc.', 'JXWX Enterprises', 'Brandon A. Mantilla', 'Jory International'],
-            'Square Feet': [4021, 1800, 1021, 1200],
-            'Rate/SF': [19.74, 26.00, 22.00, 19.38],
-            'Monthly Rent': [6614, 3900, 1872, 1938],
-            'Lease Start': ['2023-01-01', '2023-03-01', '2023-02-15', '2023-04-01'],
-            'Lease End': ['2025-12-31', '2026-02-28', '2025-02-14', '2026-03-31'],
-            'Status': ['Active', 'Active', 'Active', 'Active']
-        }
-        
-        df_rent_roll = pd.DataFrame(rent_roll_data)
-        st.dataframe(df_rent_roll, use_container_width=True)
+        df_rent_roll = _RENT_ROLL_DF
+        st.dataframe(
+            df_rent_roll,
+            use_container_width=True,
+            column_config={
+                'Rate/SF': st.column_config.NumberColumn(format='$%.2f'),
+                'Monthly Rent': st.column_config.NumberColumn(format='dollar')
+            }
+        )
         
         # Summary metrics
         col1, col2, col3 = st.columns(3)
@@ -474,23 +670,18 @@ def show_deal_analysis(calc):
                 if st.button("Add Expense"):
                     st.success("Expense added successfully!")
         
-        # Sample expense data
-        expense_data = {
-            'Date': ['2024-01-15', '2024-01-20', '2024-02-01', '2024-02-15'],
-            'Category': ['Repairs & Maintenance', 'Property Management', 'Insurance', 'Utilities'],
-            'Amount': [1250.00, 550.00, 412.50, 183.75],
-            'Description': ['HVAC Repair Unit 105', 'Monthly Management Fee', 'Quarterly Insurance Premium', 'Electric Bill'],
-            'Vendor': ['ABC HVAC Services', 'Premier Property Mgmt', 'State Farm Insurance', 'Texas Electric']
-        }
-        
-        df_expenses = pd.DataFrame(expense_data)
-        st.dataframe(df_expenses, use_container_width=True)
-        
+        st.dataframe(
+            _EXPENSES_DF,
+            use_container_width=True,
+            column_config={
+                'Amount': st.column_config.NumberColumn(format='dollar')
+            }
+        )
+
         # Expense summary chart
-        expense_by_category = df_expenses.groupby('Category')['Amount'].sum()
         fig_expenses = px.pie(
-            values=expense_by_category.values,
-            names=expense_by_category.index,
+            values=_EXPENSES_BY_CATEGORY.values,
+            names=_EXPENSES_BY_CATEGORY.index,
             title="Expenses by Category"
         )
         st.plotly_chart(fig_expenses, use_container_width=True)
@@ -498,39 +689,29 @@ def show_deal_analysis(calc):
     with tabs[3]:
         st.subheader("🏘️ Market Comparables")
         
-        # Sample comparable properties
-        comps_data = {
-            'Property': ['Oak Street Apartments', 'Riverside Complex', 'Metro Gardens', 'Sunset Plaza'],
-            'Distance': ['0.3 miles', '0.7 miles', '1.2 miles', '1.5 miles'],
-            'Units': [124, 96, 156, 88],
-            'Sale Price': [2800000, 2100000, 3400000, 1950000],
-            'Price/SF': [290, 275, 295, 285],
-            'Cap Rate': [6.2, 6.8, 5.9, 7.1],
-            'Sale Date': ['2024-01-15', '2023-11-30', '2024-02-20', '2023-12-10']
-        }
-        
-        df_comps = pd.DataFrame(comps_data)
-        
-        # Format the dataframe
-        df_comps['Sale Price'] = df_comps['Sale Price'].apply(lambda x: f"${x:,.0f}")
-        df_comps['Price/SF'] = df_comps['Price/SF'].apply(lambda x: f"${x}")
-        df_comps['Cap Rate'] = df_comps['Cap Rate'].apply(lambda x: f"{x}%")
-        
-        st.dataframe(df_comps, use_container_width=True)
+        st.dataframe(
+            _COMPS_DF,
+            use_container_width=True,
+            column_config={
+                'Sale Price': st.column_config.NumberColumn(format='dollar'),
+                'Price/SF': st.column_config.NumberColumn(format='$%d'),
+                'Cap Rate': st.column_config.NumberColumn(format='%.1f%%')
+            }
+        )
         
         # Market analysis
         st.subheader("Market Analysis")
         col1, col2 = st.columns(2)
         
         with col1:
-            avg_price_sf = np.mean([290, 275, 295, 285])
-            st.metric("Average Price/SF", f"${avg_price_sf:.0f}")
-            
+            st.metric("Average Price/SF", f"${_AVG_COMP_PRICE_SF:.0f}")
+
         with col2:
-            avg_cap_rate = np.mean([6.2, 6.8, 5.9, 7.1])
-            st.metric("Average Cap Rate", f"{avg_cap_rate:.1f}%")
+            st.metric("Average Cap Rate", f"{_AVG_COMP_CAP_RATE:.1f}%")
 
 def show_market_intelligence():
+    import plotly.graph_objects as go
+
     st.markdown('<div class="section-header">🌍 Market Intelligence</div>', unsafe_allow_html=True)
     
     # Market selection
@@ -626,22 +807,7 @@ def show_document_center():
     # Document list
     st.subheader("Document Library")
     
-    # Sample documents
-    docs_data = {
-        'Document': [
-            'Purchase Agreement - Sunset Apartments.pdf',
-            'LOI - Downtown Office Complex.pdf',
-            'Partnership Agreement - Phoenix Warehouse.pdf',
-            'Inspection Report - Sunset Apartments.pdf'
-        ],
-        'Type': ['Contract', 'LOI', 'Partnership', 'Report'],
-        'Upload Date': ['2024-01-15', '2024-01-14', '2024-01-12', '2024-01-16'],
-        'Size': ['2.4 MB', '1.8 MB', '3.1 MB', '5.2 MB'],
-        'AI Status': ['✅ Reviewed', '⚠️ Issues Found', '🔄 Processing', '✅ Reviewed']
-    }
-    
-    df_docs = pd.DataFrame(docs_data)
-    st.dataframe(df_docs, use_container_width=True)
+    st.dataframe(_DOCS_DF, use_container_width=True)
     
     # AI insights
     st.subheader("AI Document Insights")
@@ -662,16 +828,7 @@ def show_collaboration():
     # Active collaborations
     st.subheader("Active Deal Collaborations")
     
-    # Sample collaboration data
-    collab_data = {
-        'Deal': ['Sunset Apartments', 'Downtown Office Complex', 'Industrial Warehouse'],
-        'Partners': ['3 partners', '2 partners', '4 partners'],
-        'Status': ['Active', 'Pending Signatures', 'Under Review'],
-        'Last Activity': ['2 hours ago', '1 day ago', '3 hours ago']
-    }
-    
-    df_collab = pd.DataFrame(collab_data)
-    st.dataframe(df_collab, use_container_width=True)
+    st.dataframe(_COLLAB_DF, use_container_width=True)
     
     # Partner management
     st.subheader("Invite New Partner")